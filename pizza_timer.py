@@ -1,126 +1,80 @@
 #!/usr/bin/env python
 
 from dataclasses import dataclass, field
+from fractions import Fraction
+from functools import lru_cache
 import math
 from pathlib import Path
 import random
-import time
+import numpy as np
 try:
     import tomllib
 except ImportError:
     import toml as tomllib
 import pygame
-import pygame.gfxdraw as gfx
 
 _IMG_ROOT = 'images'
-_ASSET_CACHE = {}
-
-
+_IMG_DIR = Path(__file__).parent / _IMG_ROOT
+_WEDGE_STEP = 0.2  # angular resolution of the pizza wedge in degrees
+_FRAC_GLYPH = {
+    (1, 2): '½',
+    (1, 3): '⅓', (2, 3): '⅔',
+    (1, 4): '¼', (3, 4): '¾',
+    (1, 5): '⅕', (2, 5): '⅖', (3, 5): '⅗', (4, 5): '⅘',
+    (1, 6): '⅙', (5, 6): '⅚',
+    (1, 8): '⅛', (3, 8): '⅜', (5, 8): '⅝', (7, 8): '⅞',
+}
+
+
+@lru_cache(maxsize=None)
 def load_pizza_image(name: str) -> pygame.Surface:
-    path = Path(__file__).parent / _IMG_ROOT / name
-    key  = str(path)
-    if key not in _ASSET_CACHE:
-        img = pygame.image.load(path).convert_alpha()
-        _ASSET_CACHE[key] = img
-    return _ASSET_CACHE[key]
+    return pygame.image.load(_IMG_DIR / name).convert_alpha()
 
 
 def get_tick_text(total_hours: float, div_hour: float, 
                   tick_count: int) -> list[str]:
-    tol = 1e-6
-    sec_hours = [i * div_hour for i in range(tick_count)] + [total_hours]
+    # snapped to whole seconds, the hours below are exact fractions
+    # without floating point noise
+    div_frac = Fraction(round(div_hour * 3600), 3600)
+    sec_hours = [i * div_frac for i in range(tick_count)]
+    sec_hours.append(Fraction(round(total_hours * 3600), 3600))
     
     tick_text = []
     for h in sec_hours:
-        if abs(h % 1.0) < tol:
+        whole_h, rem = divmod(h.numerator, h.denominator)
+        glyph = _FRAC_GLYPH.get((rem, h.denominator))
+        if not rem:
             # whole hours
-            txt = f'{int(h)}'
-        elif abs((2 * h) % 1.0) < tol:
-            # half hours
-            whole_h = int(h)
-            whole_txt = f'{whole_h}' if whole_h else ''
-            txt = f'{whole_txt}½'
-        elif abs((3 * h) % 1.0) < tol:
-            # third hours
-            whole_h = int(h)
-            whole_txt = f'{whole_h}' if whole_h else ''
-            tmp = 3 * (h % 1.0)
-            if abs(tmp - 1.0) < tol:
-                txt = f'{whole_txt}⅓'
-            else:
-                txt = f'{whole_txt}⅔'
-        elif abs((4 * h) % 1.0) < tol:
-            # quarter hours
-            whole_h = int(h)
+            txt = f'{whole_h}'
+        elif glyph is not None:
             whole_txt = f'{whole_h}' if whole_h else ''
-            tmp = 4 * (h % 1.0)
-            if abs(tmp - 1.0) < tol:
-                txt = f'{whole_txt}¼'
-            elif abs(tmp - 3.0) < tol:
-                txt = f'{whole_txt}¾'
-        elif abs((5 * h) % 1.0) < tol:
-            # fifth hours
-            whole_h = int(h)
-            whole_txt = f'{whole_h}' if whole_h else ''
-            tmp = 5 * (h % 1.0)
-            if abs(tmp - 1.0) < tol:
-                txt = f'{whole_txt}⅕'
-            elif abs(tmp - 2.0) < tol:
-                txt = f'{whole_txt}⅖'
-            elif abs(tmp - 3.0) < tol:
-                txt = f'{whole_txt}⅗'
-            elif abs(tmp - 4.0) < tol:
-                txt = f'{whole_txt}⅘'
-        elif abs((6 * h) % 1.0) < tol:
-            # sixth hours
-            whole_h = int(h)
-            whole_txt = f'{whole_h}' if whole_h else ''
-            tmp = 6 * (h % 1.0)
-            if abs(tmp - 1.0) < tol:
-                txt = f'{whole_txt}⅙'
-            elif abs(tmp - 5.0) < tol:
-                txt = f'{whole_txt}⅚'
-        elif abs((8 * h) % 1.0) < tol:
-            # eighth hours
-            whole_h = int(h)
-            whole_txt = f'{whole_h}' if whole_h else ''
-            tmp = 8 * (h % 1.0)
-            if abs(tmp - 1.0) < tol:
-                txt = f'{whole_txt}⅛'
-            elif abs(tmp - 3.0) < tol:
-                txt = f'{whole_txt}⅜'
-            elif abs(tmp - 5.0) < tol:
-                txt = f'{whole_txt}⅝'
-            elif abs(tmp - 7.0) < tol:
-                txt = f'{whole_txt}⅞'
+            txt = f'{whole_txt}{glyph}'
         else:
-            # other fractions
-            txt = f'{h:.2f}'
+            # other fractions, rounded half up to two decimals
+            txt = f'{math.floor(h * 100 + Fraction(1, 2)) / 100:.2f}'
         tick_text.append(txt)
     
     return tick_text
 
 
-def draw_filled_wedge(
-    surf: pygame.Surface,
+def _wedge_rect(
     centre: tuple[int, int],
-    radius: int,
+    radius: float,
     ang0: float,
     ang1: float,
-    colour: tuple[int, int, int, int],
-    step: float = 1.0,
-) -> None:
-    nstep = int((ang1 - ang0) / step)
-    angles = [math.radians(ang0 + i * step) for i in range(nstep + 1)]
-    pts = [centre]
-    for ang in angles:
-        pts.append((centre[0] + radius * math.cos(ang),
-                    centre[1] + radius * math.sin(ang)))
-
-    if len(pts) < 3:
-        return  # not enough points to form a polygon
-    gfx.filled_polygon(surf, pts, colour)
-    gfx.aapolygon(surf, pts, colour)      # thin AA outline
+) -> pygame.Rect:
+    # the bounding box of a wedge is spanned by the centre, both rim end
+    # points and every axis extreme of the circle between ang0 and ang1
+    angles = [ang0, ang1]
+    angles += range(math.ceil(ang0 / 90) * 90,
+                    math.floor(ang1 / 90) * 90 + 1, 90)
+    xs = [centre[0]] + [centre[0] + radius * math.cos(math.radians(a))
+                        for a in angles]
+    ys = [centre[1]] + [centre[1] + radius * math.sin(math.radians(a))
+                        for a in angles]
+    left, top = math.floor(min(xs)) - 1, math.floor(min(ys)) - 1
+    right, bottom = math.ceil(max(xs)) + 1, math.ceil(max(ys)) + 1
+    return pygame.Rect(left, top, right - left, bottom - top)
 
 
 @dataclass
@@ -149,6 +103,11 @@ class TimerConfig:
     def __post_init__(self):
         # Parse configuration parameters
         self.pizza_change_policy = self.pizza_change_policy.lower()
+        self.clock_background_color = tuple(
+            pygame.Color(self.clock_background_color)
+        )
+        self.background_color = tuple(pygame.Color(self.background_color))
+        self.foreground_color = tuple(pygame.Color(self.foreground_color))
 
         # Validate configuration parameters
         if self.div_hour <= 0:
@@ -170,7 +129,7 @@ class TimerConfig:
         if isinstance(self.pizza_images, str):
             if self.pizza_images == 'all':
                 self.pizza_images = sorted(
-                    (p.name for p in Path(_IMG_ROOT).glob('*.png')),
+                    (p.name for p in _IMG_DIR.glob('*.png')),
                     key=lambda name: name,
                 )
             else:
@@ -212,6 +171,27 @@ class PizzaTimer(object):
         self.screen_off_x = (sw - self.config.canvas_size) // 2
         self.screen_off_y = (sh - self.config.canvas_size) // 2
 
+        # an opaque canvas covers the screen below it, so only the borders
+        # around it have to be filled with the background colour
+        screen_rect = pygame.Rect(0, 0, sw, sh)
+        if self.config.background_color[3] < 255:
+            self._letterbox_rects = [screen_rect]
+            return
+        inner = pygame.Rect(
+            self.screen_off_x, self.screen_off_y,
+            self.config.canvas_size, self.config.canvas_size,
+        ).clip(screen_rect)
+        borders = (
+            pygame.Rect(0, 0, sw, inner.top),
+            pygame.Rect(0, inner.bottom, sw, sh - inner.bottom),
+            pygame.Rect(0, inner.top, inner.left, inner.height),
+            pygame.Rect(inner.right, inner.top,
+                        sw - inner.right, inner.height),
+        )
+        self._letterbox_rects = [
+            r for r in borders if r.width > 0 and r.height > 0
+        ]
+
     def _init_canvas(self) -> None:
         self.canvas = pygame.Surface(
             (self.config.canvas_size, self.config.canvas_size),
@@ -219,21 +199,40 @@ class PizzaTimer(object):
         )
         self.screen = pygame.display.set_mode((0, 0), pygame.RESIZABLE)
         self._compute_layout(*self.screen.get_size())
+        self._dirty = True
+        self._drawn_state = None
         
     def _init_clock(self) -> None:
         self.clock = pygame.time.Clock()
         self.total_sec = int(self.total_hours * 3600)
-        if self.config.start_second is None:
-            self.start = time.time()
-        else:
-            self.start = time.time() \
-                - (self.total_sec - self.config.start_second)
+        self._total_ms = self.total_sec * 1000
+        self._start_ms = pygame.time.get_ticks()
+        if self.config.start_second is not None:
+            self._start_ms -= int(
+                (self.total_sec - self.config.start_second) * 1000
+            )
+        self._clock_remain = None
+        self._clock_txt = None
 
     def _init_font(self) -> None:
         self.font = pygame.font.SysFont(self.config.font_name, 
                                         self.config.font_size)
         num_width, num_height = self.font.size('0')
         self.num_radius = 0.5 * math.sqrt(num_width**2 + num_height**2)
+
+        # size the clock background for the widest possible clock text
+        widest = max('0123456789', key=lambda c: self.font.size(c)[0])
+        hour_digits = len(str(self.total_sec // 3600))
+        text_w, text_h = self.font.size(
+            f'{widest * hour_digits}:{widest * 2}:{widest * 2}'
+        )
+        self._clock_bg_surf = pygame.Surface(
+            (text_w + 2 * self.config.clock_padding,
+             text_h + 2 * self.config.clock_padding),
+            pygame.SRCALPHA,
+        )
+        self._clock_bg_surf.fill(self.config.clock_background_color)
+        self._clock_bg_surf = self._clock_bg_surf.convert_alpha()
    
     def _init_pizzas(self) -> None:
         self.pizza_size = (2 * self.config.pizza_radius, 
@@ -241,6 +240,27 @@ class PizzaTimer(object):
         self.pizza_cx = self.config.canvas_size // 2
         self.pizza_cy = self.config.canvas_size // 2
         self.mask = pygame.Surface(self.pizza_size, pygame.SRCALPHA)
+        self.mask.fill((255, 255, 255, 0))
+        self._mask_last_step = None
+        self._mask_rect = pygame.Rect(0, 0, 0, 0)
+
+        # per mask pixel: angle swept clockwise from the top (in degrees),
+        # pixels per degree of arc and disc coverage; the arrays are
+        # indexed [x, y] like pygame.surfarray
+        radius = self.config.pizza_radius
+        dx, dy = np.ogrid[-radius:radius, -radius:radius]
+        dist = np.hypot(dx, dy)
+        self._mask_sweep = (
+            (np.degrees(np.arctan2(dy, dx)) + 90) % 360
+        ).astype(np.float32)
+        self._mask_arc = np.radians(dist).astype(np.float32)
+        self._disc_alpha = (
+            255 * np.clip(radius + 0.5 - dist, 0, 1)
+        ).astype(np.float32)
+        self._pizza_scratch = pygame.Surface(
+            self.pizza_size, pygame.SRCALPHA,
+        ).convert_alpha()
+        self._pizza_key = None
 
         self.pizza_images = []
         for img_name in self.config.pizza_images:
@@ -250,7 +270,7 @@ class PizzaTimer(object):
                 print(f'Warning: Pizza image "{img_name}" not found.')
                 continue
             img = pygame.transform.smoothscale(img, self.pizza_size)
-            self.pizza_images.append(img)
+            self.pizza_images.append(img.convert_alpha())
         
         self.npizza = len(self.pizza_images)
         if self.npizza == 0:
@@ -258,7 +278,9 @@ class PizzaTimer(object):
         if self.config.pizza_init_idx is None:
             self.config.pizza_init_idx = random.randint(0, self.npizza - 1)
         self.current_pizza_idx = self.config.pizza_init_idx % self.npizza
-        self.pizza_change_sec = self.config.pizza_change_interval * 3600
+        self._pizza_change_ms = max(
+            1, round(self.config.pizza_change_interval * 3600 * 1000),
+        )
         self._last_pizza_interval = 0
 
     def _init_sections(self) -> None:
@@ -282,6 +304,11 @@ class PizzaTimer(object):
             self.config.pizza_radius
             - (self.config.line_width // 2)
         )
+        self.sec_endpoints = [
+            (self.pizza_cx + self.sec_length * math.cos(ang),
+             self.pizza_cy + self.sec_length * math.sin(ang))
+            for ang in self.sec_angles
+        ]
 
         self.tick_text = get_tick_text(
             self.total_hours,
@@ -289,14 +316,89 @@ class PizzaTimer(object):
             self.tick_count,
         )
 
+        # pre-render all labels with their positions, the text is static
+        radius = self.config.pizza_radius + 1.5 * self.num_radius
+        self._tick_label_blits = []
+
+        # all labels except the first and last
+        for ang, txt in zip(self.sec_angles[1:], self.tick_text[1:-1]):
+            x = self.pizza_cx + radius * math.cos(ang)
+            y = self.pizza_cy + radius * math.sin(ang)
+            mark = self.font.render(txt, True, self.config.foreground_color)
+            self._tick_label_blits.append(
+                (mark, mark.get_rect(center=(x, y)))
+            )
+
+        # the first and last labels
+        y = self.pizza_cy - radius
+        for idx, sgn in zip((0, -1), (1, -1)):
+            txt = self.tick_text[idx]
+            w, _ = self.font.size(txt)
+            x = self.pizza_cx + sgn * (
+                0.5 * w + 0.05 * self.config.pizza_radius
+            )
+            mark = self.font.render(txt, True, self.config.foreground_color)
+            self._tick_label_blits.append(
+                (mark, mark.get_rect(center=(x, y)))
+            )
+
+        self._init_overlay()
+
+    def _init_overlay(self) -> None:
+        # segments, outline, tick labels and separator do not change while
+        # the timer runs, so they are composed once into a single surface
+        self._static_overlay = pygame.Surface(
+            (self.config.canvas_size, self.config.canvas_size),
+            flags=pygame.SRCALPHA,
+        )
+
+        for end in self.sec_endpoints:
+            pygame.draw.line(
+                self._static_overlay,
+                self.config.foreground_color,
+                (self.pizza_cx, self.pizza_cy),
+                end,
+                self.config.line_width,
+            )
+
+        pygame.draw.circle(
+            self._static_overlay,
+            self.config.foreground_color,
+            (self.pizza_cx, self.pizza_cy),
+            self.config.pizza_radius,
+            self.config.line_width,
+        )
+
+        self._static_overlay.blits(self._tick_label_blits, doreturn=False)
+
+        x0 = self.pizza_cx
+        y0 = self.pizza_cy - self.config.pizza_radius
+        top = max(
+            0, 
+            self.config.canvas_size / 2 - self.config.pizza_radius \
+                - 2.3 * self.num_radius
+        )
+        
+        y = y0
+        while y > top:
+            y2 = max(y - self.config.separator_dash_length, 0)
+            pygame.draw.line(
+                self._static_overlay,
+                self.config.foreground_color,
+                (x0, y),
+                (x0, y2),
+                self.config.separator_line_width,
+            )
+            y = y2 - self.config.separator_gap_length
+
     def run(self) -> None:
         running = True
         while running:
             running = self._handle_events()
             self._update_timer()
-            self._draw_frame()
-            
-            pygame.display.flip()
+            if self._needs_redraw():
+                self._draw_frame()
+                pygame.display.flip()
             self.clock.tick(30)
         
         pygame.quit()
@@ -310,13 +412,30 @@ class PizzaTimer(object):
                     return False
             elif ev.type == pygame.VIDEORESIZE:
                 self._compute_layout(ev.w, ev.h)
+                self._dirty = True
+            elif ev.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._dirty = True
         return True
     
-    def _update_pizza_image(self, elapsed: float) -> None:
+    def _needs_redraw(self) -> bool:
+        # only the wedge, the pizza image and the clock change over time,
+        # frames in which none of them changes are skipped
+        state = (
+            self._wedge_step,
+            self.current_pizza_idx,
+            self.remain,
+        )
+        if self._dirty or state != self._drawn_state:
+            self._dirty = False
+            self._drawn_state = state
+            return True
+        return False
+    
+    def _update_pizza_image(self, elapsed_ms: int) -> None:
         if not self.config.pizza_change_interval or self.npizza <= 1:
             return
         
-        intervals = int(elapsed // self.pizza_change_sec)
+        intervals = elapsed_ms // self._pizza_change_ms
         
         if self.config.pizza_change_policy == 'cycle':
             self.current_pizza_idx = (
@@ -325,143 +444,98 @@ class PizzaTimer(object):
 
         elif self.config.pizza_change_policy == 'random':
             if intervals != self._last_pizza_interval:
-                choices = list(range(self.npizza))
-                choices.remove(self.current_pizza_idx)
-                self.current_pizza_idx = random.choice(choices)
+                # draw from all other images by skipping the current one
+                idx = random.randrange(self.npizza - 1)
+                if idx >= self.current_pizza_idx:
+                    idx += 1
+                self.current_pizza_idx = idx
                 self._last_pizza_interval = intervals
 
     def _update_timer(self) -> None:
-        elapsed = time.time() - self.start
-        self.progress = min(1.0, elapsed / self.total_sec)
-        self.remain = max(0, self.total_sec - int(elapsed))
+        elapsed_ms = pygame.time.get_ticks() - self._start_ms
+        self.progress = min(1.0, elapsed_ms / self._total_ms)
+        self.remain = max(0, self.total_sec - elapsed_ms // 1000)
+        # the wedge is drawn in steps of _WEDGE_STEP degrees
+        self._wedge_step = int(self.progress * 360 / _WEDGE_STEP)
         
         if 0.0 < self.progress < 1.0:
-            self._update_pizza_image(elapsed)
+            self._update_pizza_image(elapsed_ms)
     
     def _draw_frame(self) -> None:
         self.canvas.fill(self.config.background_color)
         if self.progress > 0:
             self._draw_pizza()
-            self._draw_segments()
-            self._draw_tick_text()
-            self._draw_separator()
+            self.canvas.blit(self._static_overlay, (0, 0))
             self._draw_clock()
             
-            self.screen.fill(self.config.background_color)
+            for rect in self._letterbox_rects:
+                self.screen.fill(self.config.background_color, rect)
             self.screen.blit(self.canvas, 
                              (self.screen_off_x, self.screen_off_y))
     
     def _draw_pizza(self) -> None:
-        self.mask.fill((0, 0, 0, 0))
-        cx, cy  = self.pizza_size[0] // 2, self.pizza_size[1] // 2
-        radius  = self.pizza_size[0] // 2
-        end_ang = -90 + self.progress * 360
-
-        draw_filled_wedge(
-            self.mask,
-            (cx, cy),
-            radius,
-            -90, end_ang,
-            (255, 255, 255, 255),
-            step=0.2,
-        )
-
-        pizza_visible = self.pizza_images[self.current_pizza_idx].copy()
-        pizza_visible.blit(self.mask, (0, 0), 
-                           special_flags=pygame.BLEND_RGBA_MULT)
-        self.canvas.blit(
-            pizza_visible,
-            pizza_visible.get_rect(center=(self.pizza_cx, self.pizza_cy)),
-        )
-
-    def _draw_segments(self) -> None:
-        for ang in self.sec_angles:
-            x_end = self.pizza_cx + self.sec_length * math.cos(ang)
-            y_end = self.pizza_cy + self.sec_length * math.sin(ang)
-            pygame.draw.line(
-                self.canvas,
-                self.config.foreground_color,
-                (self.pizza_cx, self.pizza_cy),
-                (x_end, y_end),
-                self.config.line_width,
-            )
-    
-        pygame.draw.circle(
-            self.canvas,
-            self.config.foreground_color,
-            (self.pizza_cx, self.pizza_cy),
-            self.config.pizza_radius,
-            self.config.line_width,
-        )
-    
-    def _draw_tick_text(self) -> None:
-        radius = self.config.pizza_radius + 1.5 * self.num_radius
-        
-        # draw all labels except the first and last
-        for i, (ang, txt) in enumerate(
-            zip(self.sec_angles[1:], self.tick_text[1:-1])
-        ):
-            x = self.pizza_cx + radius * math.cos(ang)
-            y = self.pizza_cy + radius * math.sin(ang)
-            mark = self.font.render(txt, True, self.config.foreground_color)
-            rect = mark.get_rect(center=(x, y))
-            self.canvas.blit(mark, rect)
-        
-        # draw the first and last labels
-        y = self.pizza_cy - radius
-        for idx, sgn in zip((0, -1), (1, -1)):
-            txt = self.tick_text[idx]
-            w, _ = self.font.size(txt)
-            x = self.pizza_cx + sgn * (
-                0.5 * w + 0.05 * self.config.pizza_radius
+        # the wedge only grows in steps of _WEDGE_STEP degrees, so the mask
+        # has to be redrawn only when the next step is reached
+        end_step = self._wedge_step
+        if end_step != self._mask_last_step:
+            self._mask_last_step = end_step
+            cx, cy  = self.pizza_size[0] // 2, self.pizza_size[1] // 2
+            radius  = self.pizza_size[0] // 2
+            end_sweep = end_step * _WEDGE_STEP
+
+            # everything outside the bounding box of the wedge stays
+            # transparent, so only that part is computed and composed
+            rect = _wedge_rect((cx, cy), radius, -90, end_sweep - 90)
+            rect = rect.clip(self.mask.get_rect())
+            self._mask_rect = rect
+
+            # the cut along the end angle is anti-aliased by the distance
+            # of each pixel to it, the rim by the precomputed disc
+            area = (slice(rect.left, rect.right), 
+                    slice(rect.top, rect.bottom))
+            cut = np.clip(
+                (end_sweep - self._mask_sweep[area]) * self._mask_arc[area]
+                + 0.5,
+                0.0, 1.0,
             )
-            mark = self.font.render(txt, True, self.config.foreground_color)
-            rect = mark.get_rect(center=(x, y))
-            self.canvas.blit(mark, rect)
-    
-    def _draw_separator(self) -> None:
-        x0 = self.pizza_cx
-        y0 = self.pizza_cy - self.config.pizza_radius
-        top = max(
-            0, 
-            self.config.canvas_size / 2 - self.config.pizza_radius \
-                - 2.3 * self.num_radius
+            alpha = pygame.surfarray.pixels_alpha(self.mask)
+            alpha[area] = (self._disc_alpha[area] * cut).astype(np.uint8)
+            del alpha  # unlock the mask surface
+
+        rect = self._mask_rect
+        pizza_visible = self._pizza_scratch
+        pizza_key = (self.current_pizza_idx, end_step)
+        if pizza_key != self._pizza_key:
+            self._pizza_key = pizza_key
+            pizza_visible.fill((0, 0, 0, 0), rect)
+            pizza_visible.blit(self.pizza_images[self.current_pizza_idx],
+                               rect, area=rect)
+            pizza_visible.blit(self.mask, rect, area=rect,
+                               special_flags=pygame.BLEND_RGBA_MULT)
+        pizza_rect = pizza_visible.get_rect(
+            center=(self.pizza_cx, self.pizza_cy),
         )
-        
-        y = y0
-        while y > top:
-            y2 = max(y - self.config.separator_dash_length, 0)
-            pygame.draw.line(
-                self.canvas,
+        self.canvas.blit(pizza_visible, rect.move(pizza_rect.topleft),
+                         area=rect)
+
+    def _draw_clock(self) -> None:
+        # the clock text only changes once per second
+        if self.remain != self._clock_remain:
+            rem_h, tmp = divmod(self.remain, 3600) 
+            rem_m, rem_s = divmod(tmp, 60)
+            self._clock_txt = self.font.render(
+                f'{rem_h:01d}:{rem_m:02d}:{rem_s:02d}', 
+                True, 
                 self.config.foreground_color,
-                (x0, y),
-                (x0, y2),
-                self.config.separator_line_width,
             )
-            y = y2 - self.config.separator_gap_length
-    
-    def _draw_clock(self) -> None:
-        rem_h, tmp = divmod(self.remain, 3600) 
-        rem_m, rem_s = divmod(tmp, 60)
-        clock_txt = self.font.render(
-            f'{rem_h:01d}:{rem_m:02d}:{rem_s:02d}', 
-            True, 
-            self.config.foreground_color,
-        )
+            self._clock_remain = self.remain
+        clock_txt = self._clock_txt
         text_rect = clock_txt.get_rect(center=(self.pizza_cx, self.pizza_cy))
-        
-        bg_rect = pygame.Rect(
-            text_rect.left - self.config.clock_padding,
-            text_rect.top  - self.config.clock_padding,
-            text_rect.width + 2 * self.config.clock_padding,
-            text_rect.height + 2 * self.config.clock_padding,
-        )
-        bg_surf = pygame.Surface(
-            (bg_rect.width, bg_rect.height), pygame.SRCALPHA,
+        bg_rect = self._clock_bg_surf.get_rect(
+            center=(self.pizza_cx, self.pizza_cy),
         )
-        bg_surf.fill(self.config.clock_background_color)
         
-        self.canvas.blit(bg_surf, (bg_rect.left, bg_rect.top))
+        self.canvas.blit(self._clock_bg_surf, bg_rect)
         self.canvas.blit(clock_txt, text_rect)
 
 